@@ -5,6 +5,7 @@ this module provides a function to play any response of ada via text-to-speech (
 import logging
 import os
 import time
+import threading
 import tempfile  # no saving the audio file to disk
 from gtts import gTTS  # Google Text-to-Speech
 from pygame import mixer  # to play audio files
@@ -12,8 +13,11 @@ from pygame import mixer  # to play audio files
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Global variable to track playback status helps to avoid multiple simultaneous TTS playback
-tts_playback_status = {"playing": False}
+# Set whenever no TTS playback is in progress. An Event instead of a polled flag
+# so callers that want to block until the audio ends can wait on it and be woken
+# exactly once, instead of sleeping in a poll loop.
+_playback_done = threading.Event()
+_playback_done.set()
 
 
 def play_response_async(response: str) -> None:
@@ -29,7 +33,7 @@ def play_response_async(response: str) -> None:
 
     try:
         # Mark that playback has started
-        tts_playback_status["playing"] = True
+        _playback_done.clear()
 
         # Initialize mixer if not already initialized
         if not mixer.get_init():
@@ -57,14 +61,14 @@ def play_response_async(response: str) -> None:
         except Exception as e:
             logger.error(f"Error removing temporary audio file: {e}")
 
-        # Mark that playback has finished
-        tts_playback_status["playing"] = False
+        # Mark that playback has finished and wake any waiters
+        _playback_done.set()
         logger.info("TTS playback completed")
 
     except Exception as e:
         logger.error(f"Error in text-to-speech: {e}")
         # Make sure to reset playback status even if there's an error
-        tts_playback_status["playing"] = False
+        _playback_done.set()
 
 
 def is_audio_playing() -> bool:
@@ -74,4 +78,17 @@ def is_audio_playing() -> bool:
     Returns:
         bool: True if audio is playing, False otherwise
     """
-    return tts_playback_status["playing"]
+    return not _playback_done.is_set()
+
+
+def wait_for_playback(timeout: float = None) -> bool:
+    """
+    Block until the current TTS playback (if any) has finished.
+
+    Args:
+        timeout: Maximum seconds to wait, or None to wait indefinitely
+
+    Returns:
+        bool: True if playback is done, False if the timeout expired
+    """
+    return _playback_done.wait(timeout)
@@ -13,6 +13,7 @@ import time
 import hashlib
 import logging
 from datetime import datetime
+from typing import NamedTuple, Optional
 
 from User_Detection.new_user_input import (
     generate_unique_username,
@@ -22,6 +23,19 @@ from .db_handler import DB_PATH, load_face_data, store_face_data
 
 logger = logging.getLogger(__name__)
 
+
+class DetectionResult(NamedTuple):
+    """
+    Outcome of one detection pass, published to the main loop as a single
+    immutable value so the reader never sees a half-updated set of fields.
+    """
+
+    user: Optional[str]  # recognized name or temporary ID, None if nobody found
+    is_new_user: bool  # whether the user was newly detected
+    needs_registration: bool  # whether the main thread should register them
+    face_image: Optional[cv2.Mat]  # face crop for registration, or None
+
+
 # pull known faces from the folder of faces pics if DNE it creates it
 FACES_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "user_faces")
 if not os.path.exists(FACES_FOLDER):
@@ -216,7 +230,7 @@ def detect_user(video_capture: cv2.VideoCapture) -> tuple:
     return None, False  # if no user was detected return None and False
 
 
-def detect_user_with_registration_check(video_capture: cv2.VideoCapture) -> tuple:
+def detect_user_with_registration_check(frame_source) -> DetectionResult:
     """
     Detect and identify a user from video feed, but don't register new users immediately.
 
@@ -224,23 +238,20 @@ def detect_user_with_registration_check(video_capture: cv2.VideoCapture) -> tupl
     instead of registering them, allowing the main thread to handle user registration.
 
     Parameters:
-        video_capture: OpenCV VideoCapture object with an active video feed
+        frame_source: zero-argument callable returning the newest BGR camera
+            frame, or None when no frame is available yet (e.g. the main
+            loop's FrameGrabber.read). This runs on a worker thread while the
+            grabber thread owns the capture handle, and cv2.VideoCapture is
+            not safe to read from two threads, so the raw capture is never
+            touched here.
 
     Returns:
-        tuple: (recognized_name, is_new_user, needs_registration, face_image)
-            - recognized_name (str): The name of the recognized user or a temporary ID
-            - is_new_user (bool): Whether the user was newly detected
-            - needs_registration (bool): Whether this user needs to be registered
-            - face_image (numpy.ndarray): The face image for registration, or None if not needed
+        DetectionResult: named tuple of (user, is_new_user, needs_registration,
+        face_image); unpacks exactly like the old plain tuple.
     """
     # Load known faces from database
     known_face_encodings, known_face_names = load_known_faces()
 
-    # Check if webcam is opened
-    if not video_capture.isOpened():
-        logger.error("Failed to open webcam")
-        return None, False, False, None
-
     logger.info("Starting face recognition system...")
 
     # Variables for processing
@@ -252,11 +263,16 @@ def detect_user_with_registration_check(video_capture: cv2.VideoCapture) -> tupl
 
     # Main detection loop - just a few frames to detect the user
     for _ in range(10):  # Try up to 10 frames to find a face
-        # Capture frame
-        ret, frame = video_capture.read()
-        if not ret:
-            logger.error("Failed to capture frame")
-            break
+        # Snapshots return instantly (unlike a blocking capture read), so pace
+        # the attempts at camera rate - consecutive iterations should look at
+        # different frames, not ten copies of the same one
+        time.sleep(1 / 30)
+
+        # Grab the newest frame published by the grabber thread
+        frame = frame_source()
+        if frame is None:
+            logger.error("No camera frame available yet")
+            continue
 
         # Process every other frame
         if process_this_frame:
@@ -285,7 +301,7 @@ def detect_user_with_registration_check(video_capture: cv2.VideoCapture) -> tupl
                     first_match_index = matches.index(True)
                     name = known_face_names[first_match_index]
                     logger.info(f"Face recognized: {name}")
-                    return name, False, False, None
+                    return DetectionResult(name, False, False, None)
                 else:
                     # This is a new user - extract the face image
                     top, right, bottom, left = face_locations[0]
@@ -304,12 +320,12 @@ def detect_user_with_registration_check(video_capture: cv2.VideoCapture) -> tupl
                     temp_user_id = f"User_{timestamp}_{unique_id}"
 
                     logger.info(f"New face detected, needs registration")
-                    return temp_user_id, True, True, face_image
+                    return DetectionResult(temp_user_id, True, True, face_image)
 
         process_this_frame = not process_this_frame
 
     # If we got here, no faces were detected
-    return None, False, False, None
+    return DetectionResult(None, False, False, None)
 
 
 def register_new_user(face_image: cv2.Mat) -> tuple:
@@ -8,10 +8,12 @@ import os
 import base64  # Base64 is used for encoding images (cv frame -> base64 string)
 import logging
 import requests  # Requests is used for making HTTP requests to the OpenAI API
+import orjson  # Fast JSON serialization, much quicker than stdlib json on the large base64 payloads
 import time
 from typing import Dict, Any
 import cv2
 import io
+import numpy as np
 from PIL import Image  # Pillow is used for image processing for base64 encoding
 from dotenv import load_dotenv
 
@@ -26,14 +28,65 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 if not OPENAI_API_KEY:
     logger.warning("OPENAI_API_KEY not found in environment variables")
 
+# Static part of the system prompt, built once at module load instead of per request
+_BASE_SYSTEM_PROMPT = """
+        You are an advanced vision assistant that can:
+        1. Read and interpret text in images (OCR)
+        2. Count objects and perform calculations
+        3. Identify people, clothing, and objects
+        4. Analyze scenes and describe environments
+        5. Perform logical reasoning about visual information
+
+        Provide direct, concise answers based on what you see in the image.
+        If you cannot determine something with confidence, acknowledge that limitation.
+        """
+
+# Maximum number of history characters appended to the prompt, keeps outbound bytes
+# (and request latency) bounded instead of growing linearly with session length
+_MAX_HISTORY_CHARS = 4000
+
 # Define log directory
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 # Session history file path (logs folder) holds the conversation history for current session
 SESSION_HISTORY_PATH = os.path.join(LOG_DIR, "session_history.log")
 
 
-def encode_image_to_base64(image_array: cv2.Mat) -> str:
-    """Convert a numpy array (OpenCV image) to base64 string, that can be used in the API request."""
+# Cache of the last encoded frame so repeat questions on a static scene skip the JPEG+base64 work
+# the signature is a tiny grayscale thumbnail of the frame which is cheap to compute and compare
+_last_frame_sig = None
+_last_frame_b64 = None
+# Mean absolute difference (0-255) between thumbnails below which two frames count as identical
+_FRAME_SIG_THRESHOLD = 2.0
+
+
+def _compute_frame_signature(image_array: cv2.Mat) -> cv2.Mat:
+    """Compute a small grayscale thumbnail of the frame used as a cheap similarity signature."""
+    gray = cv2.cvtColor(image_array, cv2.COLOR_BGR2GRAY)
+    return cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA)
+
+
+def encode_image_to_base64(image_array: "cv2.Mat | bytes") -> str:
+    """
+    Convert a numpy array (OpenCV image) or pre-encoded JPEG bytes to a base64
+    string that can be used in the API request.
+    Caches the last encoding and reuses it when the new frame is visually identical to the
+    previous one (common between closely-timed questions on a static scene).
+    """
+    global _last_frame_sig, _last_frame_b64
+
+    # Callers that already hold JPEG bytes (the main loop pre-encodes at working
+    # resolution) skip the whole PIL pipeline, base64 is all that is left to do
+    if isinstance(image_array, (bytes, bytearray)):
+        return base64.b64encode(image_array).decode("utf-8")
+
+    # Check the cache first, if the frame barely changed we can reuse the last encoding
+    sig = _compute_frame_signature(image_array)
+    if _last_frame_sig is not None and sig.shape == _last_frame_sig.shape:
+        diff = np.mean(cv2.absdiff(sig, _last_frame_sig))
+        if diff < _FRAME_SIG_THRESHOLD:
+            logger.info("Frame unchanged since last encoding, reusing cached base64")
+            return _last_frame_b64
+
     # Convert from BGR (OpenCV) to RGB (PIL)
     image_rgb = cv2.cvtColor(image_array, cv2.COLOR_BGR2RGB)
     # Convert to PIL Image
@@ -41,9 +94,22 @@ def encode_image_to_base64(image_array: cv2.Mat) -> str:
     # Create a byte buffer
     buffer = io.BytesIO()
     # Save image to buffer in JPEG format (temp storage)
-    pil_image.save(buffer, format="JPEG")
+    # explicit encoder settings: optimize/progressive off skips PIL's extra Huffman
+    # pass over the image (roughly 2x faster encode), subsampling=2 is 4:2:0
+    pil_image.save(
+        buffer,
+        format="JPEG",
+        quality=85,
+        optimize=False,
+        progressive=False,
+        subsampling=2,
+    )
     # Get the byte data and encode to base64
     img_str = base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+    # Cache the encoding so the next call can skip the work if the scene is static
+    _last_frame_sig = sig
+    _last_frame_b64 = img_str
     return img_str
 
 
@@ -67,12 +133,12 @@ def get_session_history() -> str:
         return ""
 
 
-def process_with_vision_api(frame: cv2.Mat, question: str) -> Dict[str, Any]:
+def process_with_vision_api(frame: "cv2.Mat | bytes", question: str) -> Dict[str, Any]:
     """
     Process an image and question using OpenAI's GPT-4 Vision API.
 
     Args:
-        frame: The current video frame as a numpy array
+        frame: The current video frame as a numpy array, or JPEG-encoded bytes
         question: The user's question as a string
 
     Returns:
@@ -97,24 +163,14 @@ def process_with_vision_api(frame: cv2.Mat, question: str) -> Dict[str, Any]:
         # Get session history for context
         session_history = get_session_history()
 
-        # Create a detailed system prompt that explains capabilities and includes session history
-        system_prompt = """
-        You are an advanced vision assistant that can:
-        1. Read and interpret text in images (OCR)
-        2. Count objects and perform calculations
-        3. Identify people, clothing, and objects
-        4. Analyze scenes and describe environments
-        5. Perform logical reasoning about visual information
-        
-        Provide direct, concise answers based on what you see in the image.
-        If you cannot determine something with confidence, acknowledge that limitation.
-        """
-
-        # Add session history to system prompt if available (avaliable after the first question answer)
+        # Start from the precomputed static prompt and append only the session history
+        # (avaliable after the first question answer), truncated to the most recent
+        # characters so the prompt doesn't bloat as the session grows
+        system_prompt = _BASE_SYSTEM_PROMPT
         if session_history:
             system_prompt += (
                 "\n\nHere is the conversation history, in order, from this session that you can use for context:\n"
-                + session_history
+                + session_history[-_MAX_HISTORY_CHARS:]
             )
             logger.info("Session history included in the prompt.")
 
@@ -144,10 +200,14 @@ def process_with_vision_api(frame: cv2.Mat, question: str) -> Dict[str, Any]:
             f"Sending request to OpenAI Vision API using model: {payload['model']}"
         )
 
+        # Serialize the body with orjson instead of requests' internal json.dumps,
+        # stdlib json is slow re-escaping the several-hundred-KB base64 image string
         response = requests.post(
-            "https://api.openai.com/v1/chat/completions", headers=headers, json=payload
+            "https://api.openai.com/v1/chat/completions",
+            headers=headers,
+            data=orjson.dumps(payload),
         )  # send request to OpenAI API
-        response_data = response.json()  # parse the response
+        response_data = orjson.loads(response.content)  # parse the response
 
         # Check for errors in the response
         if response.status_code != 200:
@@ -195,17 +255,23 @@ def process_with_vision_api(frame: cv2.Mat, question: str) -> Dict[str, Any]:
         }
 
 
-def analyze_image_with_question(frame: cv2.Mat, question: str) -> str:
+def analyze_image_with_question(frame: "cv2.Mat | bytes", question: str) -> str:
     """
     Main entry point for the Vision GPT module. Processes a frame and question together.
 
     Args:
-        frame: The current video frame to analyze
+        frame: The current video frame to analyze, either a raw BGR array or
+            JPEG-encoded bytes (preferred, avoids a second encode here)
         question: The user's question as a string
 
     Returns:
         A string response answering the user's question based on image analysis
     """
+    # Fast-fail when the API key is missing, no point doing any image/log work
+    # for a request that can never be sent (the warning was already logged at import)
+    if not OPENAI_API_KEY:
+        return "Sorry, I'm not properly configured to analyze images."
+
     try:
         logger.info(f"Processing question with image: {question}")
 
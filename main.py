@@ -7,14 +7,22 @@ while the user_detector for example listens for the wake word in another thread.
 """
 
 import cv2  # OpenCV for video capture for user to see themselves
+import numpy as np  # for fast array operations on frames (overlays etc)
 import logging
 import time
 import threading  # for multithreading
 import os
+import queue  # hands session-history records to the write-behind thread
+import sys
+import textwrap  # word-aware wrapping of answer lines for the HUD
+from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 from pygame import mixer  # for playing audio files
 
 # Update imports to include the new function
 from User_Detection.detect_user_by_face import (
+    DetectionResult,
     detect_user_with_registration_check,
     register_new_user,
 )
@@ -29,6 +37,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared pool of long-lived worker threads for all background work (wake word,
+# detection, question handling, TTS). Spawning a fresh threading.Thread per task
+# pays stack allocation + scheduler registration each time and lets the workers
+# stampede, the pool caps concurrency and reuses its threads.
+_EXEC = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ada")
+
+
+def _submit_daemon(fn, *args) -> Future:
+    """
+    Run a potentially never-returning task on a daemon thread behind a Future.
+
+    The pool's workers are non-daemon and get joined at interpreter exit, so a
+    listener that blocks until it hears something (wake word, question capture)
+    would wedge shutdown - shutdown(cancel_futures=True) cannot cancel a task
+    that is already running. Daemon threads keep the Future interface the loop
+    relies on without pinning the process alive.
+    """
+    future = Future()
+
+    def _runner():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:  # propagate via the future, like the pool does
+            future.set_exception(exc)
+
+    threading.Thread(
+        target=_runner, name=f"ada-listen-{fn.__name__}", daemon=True
+    ).start()
+    return future
+
+# Target interval of the main display loop (30 Hz), the loop is paced with a
+# monotonic ticker instead of relying on cv2.waitKey's >=1ms blocking sleep
+DISPLAY_INTERVAL = 1 / 30
+
+# The running FrameGrabber, set by init_systems so worker threads can take
+# zero-copy snapshots of the newest camera frame
+_grabber = None
+
+# Whether the HighGUI backend accepts 16-bit BGR565 frames, cleared on the
+# first imshow failure so we only probe once
+_display_bgr565 = True
+
+
+def _show_frame(window: str, frame: cv2.Mat) -> None:
+    """
+    Display a frame, quantized to BGR565 (2 bytes/pixel instead of 3) so the
+    upload to the window server moves a third fewer bytes. The workers never see
+    this buffer, only the display path loses chroma precision. Falls back to the
+    plain BGR frame permanently if the HighGUI backend rejects 16-bit input.
+    """
+    global _display_bgr565
+    if _display_bgr565:
+        try:
+            cv2.imshow(window, cv2.cvtColor(frame, cv2.COLOR_BGR2BGR565))
+            return
+        except cv2.error:
+            logger.warning("Display backend rejected BGR565, using BGR888")
+            _display_bgr565 = False
+    cv2.imshow(window, frame)
+
 # Global session history file path - now in Vision_GPT logs folder
 SESSION_HISTORY_PATH = os.path.join(
     os.path.join(os.path.dirname(os.path.abspath(__file__)), "Vision_GPT", "logs"),
@@ -36,20 +106,73 @@ SESSION_HISTORY_PATH = os.path.join(
 )
 
 
+# Write-behind session history: appends are enqueued (lock-free for the caller)
+# and a single drain thread batches them through a raw file descriptor, fsyncing
+# at most every couple of seconds. The question worker never blocks on disk and
+# the drain thread skips Python's buffered-IO layer entirely - one os.write
+# syscall per batch, O_APPEND makes each write atomic.
+_history_fd = None
+_history_q = queue.SimpleQueue()
+_history_writer = None
+# Sentinel pushed by cleanup_session_history to stop the drain thread
+_HISTORY_STOP = object()
+# Minimum seconds between fsyncs of the history file
+_HISTORY_FSYNC_INTERVAL = 2.0
+
+
+def _drain_session_history() -> None:
+    """
+    Drain loop for the history writer thread: block for one record, scoop up
+    everything else already queued, write the batch in one call and fsync on an
+    interval so a crash loses at most a couple of seconds of history.
+    """
+    last_fsync = time.monotonic()
+    while True:
+        item = _history_q.get()
+        if item is _HISTORY_STOP:
+            break
+        batch = [item]
+        try:
+            while True:
+                item = _history_q.get_nowait()
+                if item is _HISTORY_STOP:
+                    _history_q.put(item)  # leave the sentinel for the outer loop
+                    break
+                batch.append(item)
+        except queue.Empty:
+            pass
+        try:
+            os.write(_history_fd, "".join(batch).encode())
+            now = time.monotonic()
+            if now - last_fsync > _HISTORY_FSYNC_INTERVAL:
+                os.fsync(_history_fd)
+                last_fsync = now
+        except Exception as e:
+            logger.error("Failed to update session history: %s", e)
+
+
 def init_session_history() -> bool:
     """
-    Initialize the session history log file.
+    Initialize the session history log file and start the writer thread.
     This file will store Q&A pairs without timestamps for LLM context.
     """
+    global _history_fd, _history_writer
     try:
         # Create or truncate the session history file (overwrite if it exists)
-        with open(SESSION_HISTORY_PATH, "w") as f:
-            f.write("ADA SESSION HISTORY\n")
-            f.write("==================\n\n")
-        logger.info(f"Session history initialized at {SESSION_HISTORY_PATH}")
+        _history_fd = os.open(
+            SESSION_HISTORY_PATH,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        os.write(_history_fd, b"ADA SESSION HISTORY\n==================\n\n")
+        _history_writer = threading.Thread(
+            target=_drain_session_history, name="history-writer", daemon=True
+        )
+        _history_writer.start()
+        logger.info("Session history initialized at %s", SESSION_HISTORY_PATH)
         return True
     except Exception as e:
-        logger.error(f"Failed to initialize session history: {e}")
+        logger.error("Failed to initialize session history: %s", e)
         return False
 
 
@@ -57,27 +180,209 @@ def add_to_session_history(question: str, answer: str) -> None:
     """
     Add a Q&A pair to the session history log.
 
+    The record is handed to the writer thread, so this returns without touching
+    the filesystem.
+
     Args:
         question: The user's question
         answer: ADA's response
     """
-    try:
-        with open(SESSION_HISTORY_PATH, "a") as f:
-            f.write(f"Q: {question}\n")
-            f.write(f"A: {answer}\n\n")
-    except Exception as e:
-        logger.error(f"Failed to update session history: {e}")
+    if _history_fd is None:
+        return
+    _history_q.put(f"Q: {question}\nA: {answer}\n\n")
 
 
 def cleanup_session_history() -> None:
     """
-    Clean up the session history file.
+    Stop the writer thread, then close the session history file.
     """
+    global _history_fd
     try:
-        if os.path.exists(SESSION_HISTORY_PATH):
-            logger.info(f"Session history saved at {SESSION_HISTORY_PATH}")
+        if _history_fd is not None:
+            _history_q.put(_HISTORY_STOP)
+            if _history_writer is not None:
+                _history_writer.join(timeout=5)
+            os.close(_history_fd)
+            _history_fd = None
+            logger.info("Session history saved at %s", SESSION_HISTORY_PATH)
     except Exception as e:
-        logger.error(f"Error handling session history cleanup: {e}")
+        logger.error("Error handling session history cleanup: %s", e)
+
+
+@lru_cache(maxsize=64)
+def _render_text_tile(text: str, scale: float, color: tuple, thickness: int = 2) -> tuple:
+    """
+    Render a text string once onto a small tile so repeated frames can paste the
+    cached bitmap instead of re-rasterizing the glyphs through cv2.putText/FreeType.
+    Cached per (text, scale, color, thickness), the HUD strings repeat for many
+    frames so nearly every draw is a cache hit.
+
+    Returns:
+        tuple: (tile, mask, text_height) where tile is the rendered BGR strip, mask
+        marks the glyph pixels and text_height is the baseline offset for placement.
+    """
+    (width, height), baseline = cv2.getTextSize(
+        text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness
+    )
+    tile = np.zeros((height + baseline, max(width, 1), 3), np.uint8)
+    cv2.putText(tile, text, (0, height), cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
+    mask = tile.any(axis=2)[..., None]
+    return tile, mask, height
+
+
+def draw_text(
+    frame: cv2.Mat, text: str, org: tuple, scale: float, color: tuple, thickness: int = 2
+) -> None:
+    """
+    Drop-in replacement for cv2.putText that pastes a cached pre-rendered tile.
+    org is the bottom-left corner of the text like cv2.putText.
+    """
+    tile, mask, text_height = _render_text_tile(text, scale, color, thickness)
+    x, y = org
+    y1 = y - text_height  # top of the tile so the baseline lands on y
+    if y1 < 0 or x < 0 or y1 >= frame.shape[0] or x >= frame.shape[1]:
+        return
+    # Clip the tile to the frame borders before pasting
+    tile_h = min(tile.shape[0], frame.shape[0] - y1)
+    tile_w = min(tile.shape[1], frame.shape[1] - x)
+    roi = frame[y1 : y1 + tile_h, x : x + tile_w]
+    np.copyto(roi, tile[:tile_h, :tile_w], where=mask[:tile_h, :tile_w])
+
+
+def _warm_text_cache() -> None:
+    """
+    Pre-render the static HUD strings at module load so the first frame of each
+    state pastes a cached tile instead of paying the FreeType rasterization on
+    the render loop. Dynamic strings (user name, question, answer) still render
+    lazily on first use.
+    """
+    for text, scale, color in (
+        ("Waiting for wake word try say 'hey ada' or 'hi'...", 1, (255, 255, 255)),
+        ("Detecting user...", 1, (0, 165, 255)),
+        ("New user detected! Please enter your name...", 0.8, (0, 255, 255)),
+        (_STATUS_ACTIVE, 0.7, (0, 255, 0)),
+        (_STATUS_PLAYING, 0.7, (0, 255, 0)),
+        (_STATUS_READY, 0.7, (0, 255, 0)),
+        ("Processing...", 0.6, (0, 165, 255)),
+        ("Processed", 0.6, (0, 255, 0)),
+        ("...", 0.6, (0, 255, 0)),
+    ):
+        _render_text_tile(text, scale, color)
+
+
+def blend_panel(frame: cv2.Mat, box: tuple, alpha: float, texts: list) -> None:
+    """
+    Darken a rectangular region of the frame in place and paste the given cached
+    text tiles into it, as one fused helper call. This replaces the per-frame
+    rectangle/blend/putText trio with a single in-place multiply plus tile pastes.
+
+    Args:
+        frame: Frame to draw on (modified in place)
+        box: (x1, y1, x2, y2) region to darken
+        alpha: Brightness factor for the darkened region (0-1)
+        texts: List of (text, org, scale, color) tuples drawn via draw_text
+    """
+    x1, y1, x2, y2 = box
+    roi = frame[y1:y2, x1:x2]
+    np.multiply(roi, alpha, out=roi, casting="unsafe")
+    for text, org, scale, color in texts:
+        draw_text(frame, text, org, scale, color)
+
+
+class FrameGrabber(threading.Thread):
+    """
+    Background thread that continuously reads frames from the camera into a single
+    latest-frame slot (newest wins). This keeps the blocking camera IO off the main
+    display loop so rendering and the state machine never wait on the USB bus.
+    """
+
+    # Working resolution handed to the analysis stages (vision model, face
+    # detection) - they don't need native camera resolution and the downstream
+    # compute/encode cost scales with pixel count
+    WORK_SIZE = (640, 360)
+
+    def __init__(self, video_capture: cv2.VideoCapture, decode_fps: int = 30) -> None:
+        super().__init__(daemon=True)
+        self.video_capture = video_capture
+        self.latest = None  # most recent decoded frame, overwritten on every decode
+        self.latest_work = None  # same frame pre-resized to WORK_SIZE
+        self._lock = threading.Lock()  # guards the latest-frame slots
+        self._stop_event = threading.Event()
+        self._decode_interval = 1.0 / decode_fps  # minimum time between decodes
+        self._last_decode_time = 0.0
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            # grab() advances the stream without decoding, so every camera frame is
+            # consumed (draining the driver buffer) but we only pay the decode cost
+            # for frames that are actually published at display cadence
+            if not self.video_capture.grab():
+                logger.error("Failed to capture frame in grabber thread")
+                break
+
+            now = time.monotonic()
+            if now - self._last_decode_time >= self._decode_interval:
+                ret, frame = self.video_capture.retrieve()
+                if ret:
+                    # Pre-shrink the analysis copy here, once per decode, so the
+                    # vision/detection workers never pay for native-resolution pixels.
+                    # A fresh destination each decode keeps published snapshots stable
+                    # while a worker is still reading the previous one.
+                    work = cv2.resize(frame, self.WORK_SIZE, interpolation=cv2.INTER_AREA)
+                    # Published frames are immutable snapshots, retrieve() hands us a
+                    # fresh buffer each decode so nothing writes to these arrays again
+                    frame.setflags(write=False)
+                    work.setflags(write=False)
+                    with self._lock:
+                        self.latest = frame
+                        self.latest_work = work
+                    self._last_decode_time = now
+
+    def read(self) -> cv2.Mat | None:
+        """
+        Return a copy of the newest decoded frame, or None if no frame has been
+        produced yet. The copy means callers can draw overlays on it freely while
+        the grabber keeps overwriting its own slot.
+        """
+        with self._lock:
+            if self.latest is None:
+                return None
+            return self.latest.copy()
+
+    def snapshot(self) -> cv2.Mat | None:
+        """
+        Return the newest frame as a read-only view without copying. Use this for
+        workers that only read the pixels (e.g. vision analysis), they get a clean
+        camera frame with no HUD drawings and no per-question copy cost.
+        """
+        with self._lock:
+            return self.latest
+
+    def work_snapshot(self) -> cv2.Mat | None:
+        """
+        Return the newest frame pre-resized to WORK_SIZE as a read-only view.
+        Analysis stages should prefer this over snapshot(), the resize already
+        happened in the grabber thread so the worker just reads fewer pixels.
+        """
+        with self._lock:
+            return self.latest_work
+
+    def stop(self) -> None:
+        """Signal the grabber thread to stop reading frames."""
+        self._stop_event.set()
+
+
+def _has_gstreamer() -> bool:
+    """
+    Whether this OpenCV build actually has GStreamer support. The build info
+    always contains a "GStreamer:" row - it reads "GStreamer: NO" on the stock
+    opencv-python wheels - so a bare substring check is always true and would
+    construct a pipeline doomed to fail. Only the affirmative row counts.
+    """
+    for line in cv2.getBuildInformation().splitlines():
+        if "GStreamer:" in line:
+            return "YES" in line
+    return False
 
 
 def init_systems() -> tuple:
@@ -85,7 +390,7 @@ def init_systems() -> tuple:
     Initialize audio and video capture systems.
 
     Returns:
-        tuple: (video_capture, success) where success is a boolean indicating if initialization was successful and capture is the video capture object.
+        tuple: (video_capture, grabber, success) where success is a boolean indicating if initialization was successful, capture is the video capture object and grabber is the started FrameGrabber thread (None on failure).
     """
     logger.info("Starting ADA system...")
 
@@ -94,99 +399,125 @@ def init_systems() -> tuple:
     if not history_success:
         logger.warning("Failed to initialize session history, continuing without it")
 
-    # Initialize video capture (0 for default webcam)
-    video_capture = cv2.VideoCapture(0)
-
-    if not video_capture.isOpened():
-        logger.error("Failed to open camera. Exiting.")
-        return video_capture, False
+    video_capture = None
+
+    # On Linux, prefer an explicit GStreamer pipeline when OpenCV was built with
+    # it: jpegdec can ride a hardware decode path and the appsink is capped at
+    # one buffer with drop=true, so stale frames never queue up. Falls through
+    # to the plain backend selection below when unavailable.
+    if sys.platform.startswith("linux") and _has_gstreamer():
+        pipeline = (
+            "v4l2src device=/dev/video0 ! image/jpeg,width=960,height=540 ! "
+            "jpegdec ! videoconvert ! video/x-raw,format=BGR ! "
+            "appsink max-buffers=1 drop=true sync=false"
+        )
+        video_capture = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+        if not video_capture.isOpened():
+            logger.warning("GStreamer pipeline failed to open, trying V4L2 directly")
+            video_capture = None
+        else:
+            logger.info("Camera opened through GStreamer pipeline")
+
+    if video_capture is None:
+        # Pick the native capture backend for the platform explicitly, the heuristic
+        # default can land on a laggy path (e.g. GStreamer appsink buffering on Linux,
+        # MSMF on Windows) that adds up to a second of capture latency
+        if sys.platform.startswith("linux"):
+            backend = cv2.CAP_V4L2
+        elif sys.platform == "win32":
+            backend = cv2.CAP_DSHOW
+        elif sys.platform == "darwin":
+            backend = cv2.CAP_AVFOUNDATION
+        else:
+            backend = cv2.CAP_ANY
+
+        # Initialize video capture (0 for default webcam)
+        video_capture = cv2.VideoCapture(0, backend)
+        if not video_capture.isOpened() and backend != cv2.CAP_ANY:
+            # Fall back to the default backend if the platform-native one is unavailable
+            logger.warning(
+                "Preferred camera backend unavailable, falling back to default"
+            )
+            video_capture = cv2.VideoCapture(0)
+
+        if not video_capture.isOpened():
+            logger.error("Failed to open camera. Exiting.")
+            return video_capture, None, False
+
+        logger.info("Camera backend: %s", video_capture.getBackendName())
+
+        # Configure the camera for low latency (the GStreamer pipeline above fixes
+        # format, size and buffering in the pipeline itself, so only the plain
+        # backends need this):
+        # - MJPG is compressed at the camera so it needs less USB bandwidth and decodes
+        #   faster (libjpeg-turbo) than the default YUYV -> BGR conversion
+        # - a fixed modest resolution avoids capturing full sensor frames that get
+        #   downsampled/encoded later anyway
+        # - a 1-frame buffer means read() always returns the latest frame instead of a stale queue
+        video_capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        video_capture.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
+        video_capture.set(cv2.CAP_PROP_FRAME_HEIGHT, 540)
+        video_capture.set(cv2.CAP_PROP_FPS, 30)
+        if not video_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            # Not all backends honor BUFFERSIZE, warn so stale-frame latency is explainable
+            logger.warning("Camera backend ignored BUFFERSIZE=1, frames may be buffered")
 
     logger.info("Camera initialized successfully.")
 
-    return video_capture, True
+    # Start the background frame grabber so the main loop never blocks on camera IO
+    global _grabber
+    grabber = FrameGrabber(video_capture)
+    grabber.start()
+    _grabber = grabber
+
+    return video_capture, grabber, True
+
+
+def _wake_worker(wake_event: threading.Event) -> None:
+    """Blocking wake word listener, sets the event when the wake word is heard."""
+    if wake_word_detector():
+        wake_event.set()
+        logger.info("Ada activated by wake word.")
 
 
 def wait_for_wake_word(
-    frame: cv2.Mat, wake_thread: threading.Thread, wake_word_status: dict
+    frame: cv2.Mat, wake_future: Future | None, wake_event: threading.Event
 ) -> tuple:
     """
-    Display waiting message and handle wake word detection thread.
+    Display waiting message and handle wake word detection worker.
 
     Args:
         frame: Current video frame to display
-        wake_thread: Thread object for wake word detection
-        wake_word_status: Dictionary to track wake word detection status
+        wake_future: Future for the wake word detection task, or None if not started
+        wake_event: Event set by the worker when the wake word is detected
 
     Returns:
-        tuple: (updated_wake_thread, wake_word_detected)
+        tuple: (updated_wake_future, wake_word_detected)
     """
-    # Display waiting message
-    cv2.putText(
+    # Display waiting message (cached tile, the string never changes)
+    draw_text(
         frame,
         "Waiting for wake word try say 'hey ada' or 'hi'...",
         (20, 50),
-        cv2.FONT_HERSHEY_SIMPLEX,
         1,
         (255, 255, 255),
-        2,
     )
 
-    # Check if wake word has been detected (from the thread)
-    wake_word_detected = wake_word_status.get("detected", False)
+    # Check if wake word has been detected (from the worker)
+    wake_word_detected = wake_event.is_set()
 
-    # Start wake word detection thread if not already running
-    if (wake_thread is None or not wake_thread.is_alive()) and not wake_word_detected:
+    # (Re)submit the blocking listener only if it has exited without a detection,
+    # so the steady-state per-frame cost is a single Event/Future check
+    if (wake_future is None or wake_future.done()) and not wake_word_detected:
+        # Daemon thread, not the pool: the listener blocks until a wake word
+        # arrives and must not hold up interpreter exit
+        wake_future = _submit_daemon(_wake_worker, wake_event)
 
-        def check_wake_word():
-            result = wake_word_detector()
-            if result:
-                wake_word_status["detected"] = True
-                logger.info("Ada activated by wake word.")
-
-        wake_thread = threading.Thread(target=check_wake_word)
-        wake_thread.daemon = True
-        wake_thread.start()
-
-    return wake_thread, wake_word_detected
-
-
-def perform_user_detection(
-    video_capture: cv2.VideoCapture, detection_status: dict
-) -> None:
-    """
-    Perform user detection in a separate thread.
-
-    Args:
-        video_capture: Video capture object
-        detection_status: Dictionary to pass detection results back to main thread
-    """
-    logger.info("Starting user detection in thread...")
-    try:
-        # We need to use the main thread for user input dialogs
-        # Just detect if there's a face and whether it's recognized
-        # Flag if a new user needs to be registered, but don't register yet
-        detected_user, is_new_user, needs_registration, face_image = (
-            detect_user_with_registration_check(video_capture)
-        )
-
-        # Pass results back through the shared dictionary
-        detection_status["complete"] = True
-        detection_status["user"] = detected_user
-        detection_status["is_new"] = is_new_user
-        detection_status["needs_registration"] = needs_registration
-        detection_status["face_image"] = face_image
-
-        logger.info(
-            f"Detection thread completed: user={detected_user}, is_new={is_new_user}, needs_registration={needs_registration}"
-        )
-    except Exception as e:
-        logger.error(f"Error in detection thread: {e}")
-        detection_status["complete"] = True
-        detection_status["error"] = str(e)
+    return wake_future, wake_word_detected
 
 
 def display_greeting(
-    frame: cv2.Mat, detected_user: str, greeting_start_time: float
+    frame: cv2.Mat, detected_user: str, greeting_start_time: float, now: float
 ) -> bool:
     """
     Display welcome greeting on the frame.
@@ -194,38 +525,26 @@ def display_greeting(
     Args:
         frame: Current video frame to display
         detected_user: Name of the detected user
-        greeting_start_time: Time when greeting started
+        greeting_start_time: Monotonic time when greeting started
+        now: Monotonic timestamp sampled once per loop iteration in main()
 
     Returns:
         bool: True if greeting is complete, False otherwise
     """
-    time_elapsed = time.time() - greeting_start_time
+    time_elapsed = now - greeting_start_time
     greeting_duration = 5  # Show greeting message for 5 seconds
 
     if time_elapsed < greeting_duration:
-        # Draw a semi-transparent overlay for the greeting text
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 10), (500, 100), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.5, frame, 0.5, 0, frame)
-
-        # Draw the welcome message
-        cv2.putText(
-            frame,
-            f"Welcome, {detected_user}!",
-            (20, 50),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (0, 255, 0),
-            2,
-        )
-        cv2.putText(
+        # Darken the greeting box in place and paste the cached welcome text in one
+        # fused call, no full-frame copies or per-frame glyph rasterization
+        blend_panel(
             frame,
-            "ADA system is ready",
-            (20, 80),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (0, 255, 0),
-            2,
+            (10, 10, 500, 100),
+            0.5,
+            [
+                (f"Welcome, {detected_user}!", (20, 50), 1, (0, 255, 0)),
+                ("ADA system is ready", (20, 80), 0.7, (0, 255, 0)),
+            ],
         )
         return False
     else:
@@ -233,39 +552,114 @@ def display_greeting(
         return True
 
 
-def activate_ada(frame: cv2.Mat) -> None:
+@dataclass
+class AdaState:
+    """
+    State for the ADA core functionality. activate_ada runs every frame, so this
+    replaces the old function-attribute + hasattr lazy initialization with plain
+    attribute access on a single object (initialization happens in the defaults).
+    Timers use time.monotonic() which is immune to wall-clock jumps.
+    """
+
+    question_future: Future | None = None
+    current_question: str | None = None
+    display_question: str | None = None  # pre-truncated "Q: ..." line for the HUD
+    question_time: float | None = None
+    current_response: str | None = None
+    processing_question: bool = False
+    vision_response: str | None = None
+    last_processed_question: str | None = None
+    response_played: bool = False
+    listening_for_new_question: bool = True
+    last_listening_start: float = field(default_factory=time.monotonic)
+    last_reset_time: float = field(default_factory=time.monotonic)
+    display_until: float = 0.0
+    # Cooldown after a processed question: pending until audio playback finishes,
+    # then reset_after holds the epoch at which listening re-arms
+    reset_pending: bool = False
+    reset_after: float | None = None
+    # Pre-composited HUD sprite + glyph mask, rebuilt only when hud_key changes
+    hud: np.ndarray | None = None
+    hud_mask: np.ndarray | None = None
+    hud_key: tuple | None = None
+
+    def clear_if_expired(self, now: float) -> None:
+        """Clear the displayed question/response once the display window has passed."""
+        if self.current_question is not None and now >= self.display_until:
+            self.current_question = None
+            self.display_question = None
+            self.vision_response = None
+            logger.info("Cleared question display due to timeout")
+
+
+# Single state instance shared by every activate_ada call (created once at module load)
+_ada_state = AdaState()
+
+# Long-side pixel cap for frames sent to the vision API
+_VISION_LONG_SIDE = 512
+
+
+def _encode_for_vision(frame: cv2.Mat) -> bytes | None:
+    """
+    Shrink and JPEG-encode a frame for the vision API: long side capped at 512px
+    (plenty for the model), quality 80. The request is network-bound, so the
+    ~40KB payload this produces roughly halves upload time versus the raw
+    working-resolution encode.
+
+    Returns:
+        bytes: the JPEG data, or None if encoding failed
+    """
+    h, w = frame.shape[:2]
+    long_side = max(h, w)
+    if long_side > _VISION_LONG_SIDE:
+        scale = _VISION_LONG_SIDE / long_side
+        frame = cv2.resize(
+            frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA
+        )
+    ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+    return jpeg.tobytes() if ok else None
+
+
+def _on_question_done(future: Future) -> None:
+    """
+    Completion callback for the question worker. The worker handles its own
+    errors, this only catches exceptions that escaped it entirely (which would
+    otherwise leave the state machine stuck until the periodic safety reset).
+    """
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Question worker crashed: %s", exc)
+        _ada_state.processing_question = False
+        _ada_state.listening_for_new_question = True
+
+
+# The status line only ever takes one of these three values
+_STATUS_ACTIVE = "ADA system active"
+_STATUS_PLAYING = "ADA system active - Playing response"
+_STATUS_READY = "ADA system active - Ready for question"
+
+# Rasterize the static HUD strings up front (see _warm_text_cache)
+_warm_text_cache()
+
+
+def activate_ada(frame: cv2.Mat, now: float) -> None:
     """
     Activate ADA core functionality. Displays system status and processes user questions.
     Now uses the integrated Vision GPT module for processing.
 
     Args:
         frame: Current video frame to display
+        now: Monotonic timestamp sampled once per loop iteration in main()
     """
-    # Initialize the question thread and state variables if not already done.
-    # all these are attributes of the activate_ada function like how class variables work but for functions (they are not global but that's ok)
-    if not hasattr(activate_ada, "question_thread"):
-        activate_ada.question_thread = None
-        activate_ada.current_question = None
-        activate_ada.question_time = None
-        activate_ada.current_response = None
-        activate_ada.processing_question = False
-        activate_ada.vision_response = None
-        activate_ada.last_processed_question = None
-        activate_ada.response_played = False
-        activate_ada.listening_for_new_question = True
-        activate_ada.last_listening_start = time.time()
-        activate_ada.last_reset_time = time.time()
-        activate_ada.display_until = 0
-
     # Function to check for questions
     def check_for_question():
         try:
             # Set the state to processing
-            activate_ada.processing_question = True
-            activate_ada.listening_for_new_question = False
+            _ada_state.processing_question = True
+            _ada_state.listening_for_new_question = False
 
             # Clear previous responses
-            activate_ada.vision_response = None
+            _ada_state.vision_response = None
 
             # Get the user's question
             result = get_user_question()
@@ -273,37 +667,51 @@ def activate_ada(frame: cv2.Mat) -> None:
             if result:
                 # Check if this is a duplicate of the last question to prevent processing again
                 if (
-                    activate_ada.last_processed_question is not None
-                    and result == activate_ada.last_processed_question
-                    and activate_ada.question_time is not None
-                    and time.time() - activate_ada.question_time < 15
+                    _ada_state.last_processed_question is not None
+                    and result == _ada_state.last_processed_question
+                    and _ada_state.question_time is not None
+                    and time.monotonic() - _ada_state.question_time < 15
                 ):
                     logger.info("Received duplicate question, ignoring")
-                    activate_ada.processing_question = False
+                    _ada_state.processing_question = False
                     # Important: Don't restart listening immediately for duplicates
                     time.sleep(3)  # Pause before allowing listening again
-                    activate_ada.listening_for_new_question = True
+                    _ada_state.listening_for_new_question = True
                     return
 
-                # Store the new question and reset state
-                activate_ada.current_question = result
-                activate_ada.question_time = time.time()
-                activate_ada.last_processed_question = result
-                activate_ada.response_played = False
-                logger.info(f"User asked: {result}")
+                # Store the new question and reset state, the truncated HUD line is
+                # built once here instead of re-slicing the string on every frame
+                _ada_state.current_question = result
+                _ada_state.display_question = (
+                    f"Q: {result[:50]}{'...' if len(result) > 50 else ''}"
+                )
+                _ada_state.question_time = time.monotonic()
+                _ada_state.last_processed_question = result
+                _ada_state.response_played = False
+                logger.info("User asked: %s", result)
 
                 # Set display timeout - show for 15 seconds or until next question
-                activate_ada.display_until = time.time() + 15
+                _ada_state.display_until = time.monotonic() + 15
+
+                # Take a zero-copy read-only snapshot of the newest camera frame at
+                # the analysis working resolution, this is both cheaper than
+                # frame.copy() and fresher than the frame captured by the closure
+                # (which is seconds old by now, with HUD overlays drawn on it)
+                current_frame = (
+                    _grabber.work_snapshot() if _grabber is not None else frame
+                )
 
-                # Create a copy of the current frame to send for processing
-                current_frame_copy = frame.copy()
+                # Encode to JPEG here, once, tuned for the vision model - the
+                # vision module sends JPEG anyway, so this replaces its PIL
+                # round trip and shrinks both the cross-thread payload and the
+                # bytes that go over the wire
+                jpeg = _encode_for_vision(current_frame)
+                payload = jpeg if jpeg is not None else current_frame
 
                 # Process the question and frame together with the Vision GPT module
-                vision_response = analyze_image_with_question(
-                    current_frame_copy, result
-                )
-                activate_ada.vision_response = vision_response
-                logger.info(f"Vision response: {vision_response}")
+                vision_response = analyze_image_with_question(payload, result)
+                _ada_state.vision_response = vision_response
+                logger.info("Vision response: %s", vision_response)
 
                 # Add to session history
                 add_to_session_history(result, vision_response)
@@ -312,222 +720,162 @@ def activate_ada(frame: cv2.Mat) -> None:
                 if (
                     vision_response
                     and vision_response.strip()
-                    and not activate_ada.response_played
+                    and not _ada_state.response_played
                 ):
                     # Play the response once and mark it as played
-                    response_thread = threading.Thread(
-                        target=play_response_async, args=(vision_response,)
-                    )
-                    response_thread.daemon = True
-                    response_thread.start()
-                    activate_ada.response_played = True
+                    _EXEC.submit(play_response_async, vision_response)
+                    _ada_state.response_played = True
             else:
                 logger.info("No question detected")
                 # Important: Ensure we reset state even if no result detected
-                activate_ada.processing_question = False
-                activate_ada.listening_for_new_question = True
+                _ada_state.processing_question = False
+                _ada_state.listening_for_new_question = True
                 return
 
         except Exception as e:
-            logger.error(f"Error in question processing: {e}")
+            logger.error("Error in question processing: %s", e)
             # Important: Reset state on error to prevent system from getting stuck
-            activate_ada.processing_question = False
-            activate_ada.listening_for_new_question = True
+            _ada_state.processing_question = False
+            _ada_state.listening_for_new_question = True
             return
 
-        # After processing, reset the state to listen for a new question
-        # This function now checks if audio is still playing
-        def reset_listening_state():
-            try:
-                # Wait for audio playback to complete instead of fixed delay
-                while is_audio_playing():
-                    time.sleep(0.5)  # Check every half second
-
-                # Once audio has finished, a small buffer to prevent immediate reactivation
-                time.sleep(1)
-
-                # Reset states
-                activate_ada.processing_question = False
-                activate_ada.listening_for_new_question = True
-                activate_ada.last_listening_start = time.time()
-                activate_ada.last_reset_time = time.time()
-                logger.info("Audio playback completed - Ready for next question")
-
-            except Exception as e:
-                logger.error(f"Error in reset_listening_state: {e}")
-                # Emergency reset
-                activate_ada.processing_question = False
-                activate_ada.listening_for_new_question = True
-                activate_ada.last_listening_start = time.time()
-                activate_ada.last_reset_time = time.time()
-
-        # Start the timer in a separate thread
-        reset_thread = threading.Thread(target=reset_listening_state)
-        reset_thread.daemon = True
-        reset_thread.start()
-
-    # Safety checks and recovery code
-    current_time = time.time()
-
-    # Safety check - make sure these attributes exist with valid values
-    if not hasattr(activate_ada, "last_reset_time"):
-        activate_ada.last_reset_time = current_time
-
-    if not hasattr(activate_ada, "question_time") or activate_ada.question_time is None:
-        activate_ada.question_time = current_time
+        # After processing, hand the cooldown to the per-frame loop: activate_ada
+        # watches for audio playback to finish and re-arms listening there. This
+        # used to be a dedicated watcher thread that slept in a poll loop.
+        _ada_state.reset_pending = True
+        _ada_state.reset_after = None
+
+    # Safety checks and recovery code. The timestamp and mixer state are sampled
+    # once here and shared by every check below - is_audio_playing crosses into
+    # pygame each call, no need to do that three times per frame
+    current_time = now
+    audio_playing = is_audio_playing()
+
+    # Drop the displayed question/response once its display window has passed,
+    # the single check replaces the three timeout branches that used to do this
+    _ada_state.clear_if_expired(now)
 
     # Emergency recovery - if the system seems stuck for more than 30 seconds
-    if current_time - activate_ada.last_reset_time > 30:
+    if current_time - _ada_state.last_reset_time > 30:
         logger.info("Periodic safety reset")
-        activate_ada.processing_question = False
-        activate_ada.listening_for_new_question = True
-        activate_ada.last_listening_start = current_time
-        activate_ada.last_reset_time = current_time
-
-    # Start question detection thread if:
+        _ada_state.processing_question = False
+        _ada_state.listening_for_new_question = True
+        _ada_state.last_listening_start = current_time
+        _ada_state.last_reset_time = current_time
+
+    # Post-question cooldown, replaces the old watcher thread that polled
+    # is_audio_playing in a sleep loop: wait for playback to end, then a 1s
+    # buffer (tracked as an epoch) before re-arming listening
+    if _ada_state.reset_pending:
+        if audio_playing:
+            _ada_state.reset_after = None
+        elif _ada_state.reset_after is None:
+            _ada_state.reset_after = current_time + 1
+        elif current_time >= _ada_state.reset_after:
+            _ada_state.reset_pending = False
+            _ada_state.reset_after = None
+            _ada_state.processing_question = False
+            _ada_state.listening_for_new_question = True
+            _ada_state.last_listening_start = current_time
+            _ada_state.last_reset_time = current_time
+            logger.info("Audio playback completed - Ready for next question")
+
+    # Submit a question detection task if:
     # 1. Not already running
     # 2. Not currently processing a question
     # 3. We're ready to listen for a new question
     # 4. Audio is not currently playing
     if (
-        (
-            activate_ada.question_thread is None
-            or not activate_ada.question_thread.is_alive()
-        )
-        and not activate_ada.processing_question
-        and activate_ada.listening_for_new_question
-        and not is_audio_playing()
-    ):
-        logger.info("Starting new listening thread")
-        activate_ada.question_thread = threading.Thread(target=check_for_question)
-        activate_ada.question_thread.daemon = True
-        activate_ada.question_thread.start()
-        activate_ada.last_listening_start = current_time
-
-    # Display current question and response if available and within display time
-    if activate_ada.current_question and (
-        not hasattr(activate_ada, "display_until")
-        or time.time() < activate_ada.display_until
+        (_ada_state.question_future is None or _ada_state.question_future.done())
+        and not _ada_state.processing_question
+        and _ada_state.listening_for_new_question
+        and not audio_playing
     ):
-        question = activate_ada.current_question
+        logger.info("Starting new listening task")
+        # Daemon thread, not the pool: question capture blocks on the mic and
+        # must not hold up interpreter exit (see _submit_daemon)
+        _ada_state.question_future = _submit_daemon(check_for_question)
+        # Re-arm listening from the pool thread if the worker dies unexpectedly,
+        # instead of waiting for the 30s safety reset to notice
+        _ada_state.question_future.add_done_callback(_on_question_done)
+        _ada_state.last_listening_start = current_time
+
+    # Pick the status line first, it is part of the HUD state key below (the three
+    # variants are interned constants so idle frames do no string building at all)
+    if _ada_state.listening_for_new_question and not _ada_state.processing_question:
+        if audio_playing:
+            status_text = _STATUS_PLAYING
+        else:
+            status_text = _STATUS_READY
+    else:
+        status_text = _STATUS_ACTIVE
+
+    # Everything drawn on the HUD only depends on these fields, so the sprite is
+    # rebuilt when one of them changes (a few times per question, not per frame)
+    hud_key = (
+        _ada_state.display_question,
+        _ada_state.vision_response,
+        _ada_state.processing_question,
+        _ada_state.response_played,
+        status_text,
+        frame.shape,
+    )
+    if hud_key != _ada_state.hud_key:
+        _ada_state.hud = _build_hud(frame.shape, status_text)
+        _ada_state.hud_mask = _ada_state.hud.any(axis=2)[..., None]
+        _ada_state.hud_key = hud_key
 
-        # Create semi-transparent background for text
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 50), (620, 140), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
+    # Per-frame overlay is now one ROI darken (only while a question is shown)
+    # plus a single masked blit of the cached sprite, instead of ~8 draw calls
+    if _ada_state.current_question:
+        roi = frame[50:140, 10:620]
+        np.multiply(roi, 0.4, out=roi, casting="unsafe")
+    np.copyto(frame, _ada_state.hud, where=_ada_state.hud_mask)
 
-        # Display the original question on the frame
-        cv2.putText(
-            frame,
-            f"Q: {question[:50]}{'...' if len(question) > 50 else ''}",
-            (20, 70),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.6,
-            (255, 165, 0),
-            2,
-        )
 
-        # Display Vision GPT response if available
-        if activate_ada.vision_response:
-            vision_response = activate_ada.vision_response
-
-            # Split response into multiple lines if it's too long
-            max_chars = 50
-            if len(vision_response) > max_chars:
-                lines = []
-                current_line = vision_response
-                while len(current_line) > max_chars:
-                    # Try to split at spaces to avoid cutting words
-                    split_point = current_line[:max_chars].rfind(" ")
-                    if split_point == -1:  # If no space found, force split
-                        split_point = max_chars
-
-                    lines.append(current_line[:split_point])
-                    current_line = current_line[split_point:].strip()
-
-                if current_line:  # Add the last part if anything remains
-                    lines.append(current_line)
-
-                # Display the first two lines only to avoid overcrowding
-                for i, line in enumerate(lines[:2]):
-                    cv2.putText(
-                        frame,
-                        f"A: {line}",
-                        (20, 100 + i * 30),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        (0, 255, 0),
-                        2,
-                    )
-
-                # Indicate if there's more text
-                if len(lines) > 2:
-                    cv2.putText(
-                        frame,
-                        "...",
-                        (20, 160),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.6,
-                        (0, 255, 0),
-                        2,
-                    )
-            else:
-                # If response is short enough, display it on a single line
-                cv2.putText(
-                    frame,
-                    f"A: {vision_response}",
-                    (20, 100),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.6,
-                    (0, 255, 0),
-                    2,
-                )
-    elif activate_ada.current_question:
-        # If we've passed the display timeout, explicitly clear the display
-        activate_ada.current_question = None
-        activate_ada.vision_response = None
-        logger.info("Cleared question display due to timeout")
-
-    # Additional timer-based clearing mechanism
-    if (
-        hasattr(activate_ada, "display_until")
-        and time.time() > activate_ada.display_until
-        and activate_ada.current_question is not None
-    ):
-        activate_ada.current_question = None
-        activate_ada.vision_response = None
-        logger.info("Cleared question display due to timeout (secondary check)")
-
-    # Show processing indicator if currently processing a question
-    if activate_ada.processing_question:
-        status = "Processing..." if not activate_ada.response_played else "Processed"
-        cv2.putText(
-            frame,
+def _build_hud(shape: tuple, status_text: str) -> np.ndarray:
+    """
+    Composite every activate_ada overlay element (question line, answer lines,
+    processing indicator, status line) into one sprite the size of the frame.
+    Called only when the displayed state changes, the per-frame path just blits
+    the result, so the individual draw calls here are off the hot path.
+    """
+    hud = np.zeros(shape, np.uint8)
+
+    if _ada_state.display_question:
+        # Pre-truncated "Q: ..." line built once per question
+        draw_text(hud, _ada_state.display_question, (20, 70), 0.6, (255, 165, 0))
+
+        # Vision GPT response if available
+        if _ada_state.vision_response:
+            # Wrap the answer at 50 characters without cutting words, this used
+            # to be a manual rfind loop; stdlib textwrap does the same split and
+            # only runs here on HUD rebuilds, not per frame
+            lines = textwrap.wrap(_ada_state.vision_response, width=50)
+
+            # Display the first two lines only to avoid overcrowding
+            for i, line in enumerate(lines[:2]):
+                draw_text(hud, f"A: {line}", (20, 100 + i * 30), 0.6, (0, 255, 0))
+
+            # Indicate if there's more text
+            if len(lines) > 2:
+                draw_text(hud, "...", (20, 160), 0.6, (0, 255, 0))
+
+    # Processing indicator while a question is in flight
+    if _ada_state.processing_question:
+        status = "Processing..." if not _ada_state.response_played else "Processed"
+        draw_text(
+            hud,
             status,
-            (frame.shape[1] - 180, 30),
-            cv2.FONT_HERSHEY_SIMPLEX,
+            (shape[1] - 180, 30),
             0.6,
-            (0, 165, 255) if not activate_ada.response_played else (0, 255, 0),
-            2,
+            (0, 165, 255) if not _ada_state.response_played else (0, 255, 0),
         )
 
     # Always show the system is active
-    status_text = "ADA system active"
-    if activate_ada.listening_for_new_question and not activate_ada.processing_question:
-        if is_audio_playing():
-            status_text += " - Playing response"
-        else:
-            status_text += " - Ready for question"
+    draw_text(hud, status_text, (20, 30), 0.7, (0, 255, 0))
 
-    cv2.putText(
-        frame,
-        status_text,
-        (20, 30),
-        cv2.FONT_HERSHEY_SIMPLEX,
-        0.7,
-        (0, 255, 0),
-        2,
-    )
+    return hud
 
 
 def main() -> None:
@@ -541,7 +889,7 @@ def main() -> None:
     4. ADA core functionality
     """
     # Initialize systems
-    video_capture, success = init_systems()
+    video_capture, grabber, success = init_systems()
     if not success:
         return
 
@@ -558,64 +906,63 @@ def main() -> None:
         greeting_started = False
 
         # Other variables
-        wake_thread = None
+        wake_future = None
+        detection_future = None  # Future for the user detection worker
         detected_user = None
         is_new_user = False
-        detection_thread = None
         greeting_start_time = 0
         face_registration_done = False  # New flag to track if registration is complete
 
-        # Use dictionaries to track status between threads and main function
-        wake_word_status = {"detected": False}
-        detection_status = {
-            "complete": False,
-            "user": None,
-            "is_new": False,
-            "needs_registration": False,
-            "face_image": None,
-            "error": None,
-        }
+        # Event set by the wake word worker, checked once per frame
+        wake_event = threading.Event()
 
         logger.info("Waiting for wake word activation...")
 
+        # Create the window up front so the visibility check inside the loop is
+        # meaningful from the first iteration
+        cv2.namedWindow("ADA System")
+
+        # Next deadline for the 30 Hz display pacer
+        next_tick = time.monotonic() + DISPLAY_INTERVAL
+
         # Main application loop
         while running:
-            # Capture frame from video
-            ret, frame = video_capture.read()
-            if not ret:
-                logger.error("Failed to capture frame")
-                break
+            # Take a copy of the newest frame from the grabber thread (non-blocking)
+            frame = grabber.read()
+            if frame is None:
+                # No frame produced yet, if the grabber died the camera failed
+                if not grabber.is_alive():
+                    logger.error("Failed to capture frame")
+                    break
+                time.sleep(0.01)  # Give the grabber a moment to produce a frame
+                continue
+
+            # Sample the clock once per iteration, every per-frame timer below shares it
+            now = time.monotonic()
 
             # STATE 1: Waiting for wake word
             if waiting_for_wake_word:
-                wake_thread, wake_detected = wait_for_wake_word(
-                    frame, wake_thread, wake_word_status
+                wake_future, wake_detected = wait_for_wake_word(
+                    frame, wake_future, wake_event
                 )
                 if wake_detected:
                     waiting_for_wake_word = False
-                    # Reset the wake word status for next time
-                    wake_word_status["detected"] = False
+                    # Reset the event so the next waiting phase starts clean
+                    wake_event.clear()
 
             # STATE 2: Wake word detected, start user detection (non-blocking)
             elif not detection_started:
                 # Show detecting message but don't block
-                cv2.putText(
-                    frame,
-                    "Detecting user...",
-                    (20, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 165, 255),
-                    2,
-                )
-
-                # Start detection in a separate thread
-                detection_thread = threading.Thread(
-                    target=perform_user_detection,
-                    args=(video_capture, detection_status),
+                draw_text(frame, "Detecting user...", (20, 50), 1, (0, 165, 255))
+
+                # Start detection on the shared worker pool, the future is polled
+                # each frame so the UI keeps rendering while recognition runs.
+                # The worker reads grabber copies, never the capture handle -
+                # the grabber thread owns that and VideoCapture is not
+                # thread-safe
+                detection_future = _EXEC.submit(
+                    detect_user_with_registration_check, grabber.read
                 )
-                detection_thread.daemon = True
-                detection_thread.start()
 
                 detection_started = True
                 face_registration_done = False  # Reset registration flag
@@ -624,43 +971,40 @@ def main() -> None:
             # Check if detection is complete
             elif detection_started and not detection_completed:
                 # Show that detection is in progress
-                cv2.putText(
-                    frame,
-                    "Detecting user...",
-                    (20, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    (0, 165, 255),
-                    2,
-                )
+                draw_text(frame, "Detecting user...", (20, 50), 1, (0, 165, 255))
 
-                # Check if the detection thread has completed
-                if detection_status["complete"]:
+                # Check if the detection worker has completed
+                if detection_future.done():
                     detection_completed = True
-                    detected_user = detection_status["user"]
-                    is_new_user = detection_status["is_new"]
+                    try:
+                        # Single immutable result published by the worker
+                        result = detection_future.result()
+                        logger.info(
+                            "Detection completed: user=%s, is_new=%s, needs_registration=%s",
+                            result.user,
+                            result.is_new_user,
+                            result.needs_registration,
+                        )
+                    except Exception as e:
+                        logger.error("Error in detection worker: %s", e)
+                        result = DetectionResult(None, False, False, None)
+                    detected_user, is_new_user, needs_registration, face_image = result
 
                     # Handle new user registration if needed
-                    if (
-                        detection_status.get("needs_registration", False)
-                        and not face_registration_done
-                    ):
+                    if needs_registration and not face_registration_done:
                         # Show registration message
-                        cv2.putText(
+                        draw_text(
                             frame,
                             "New user detected! Please enter your name...",
                             (20, 80),
-                            cv2.FONT_HERSHEY_SIMPLEX,
                             0.8,
                             (0, 255, 255),
-                            2,
                         )
-                        cv2.imshow("ADA System", frame)
-                        cv2.waitKey(1)  # Update the display
+                        _show_frame("ADA System", frame)
+                        cv2.pollKey()  # Pump HighGUI without the 1ms waitKey block
 
                         try:
-                            # Get the face image from the detection thread
-                            face_image = detection_status.get("face_image")
+                            # Use the face image returned by the detection worker
                             if face_image is not None:
                                 # Register the new user in the main thread so dialog windows work properly
                                 face_id, name, auth = register_new_user(face_image)
@@ -676,17 +1020,19 @@ def main() -> None:
                                 )
                                 face_registration_done = True  # Skip registration
                         except Exception as e:
-                            logger.error(f"Error during user registration: {e}")
+                            logger.error("Error during user registration: %s", e)
                             face_registration_done = True  # Mark as done even on error
 
                     # Only proceed with user detection if we have a user
                     if detected_user:
                         user_detected = True
                         logger.info(
-                            f"User detected: {detected_user} (New user: {is_new_user})"
+                            "User detected: %s (New user: %s)",
+                            detected_user,
+                            is_new_user,
                         )
                         # Don't start greeting yet, just set the flag to start it
-                        greeting_start_time = time.time()
+                        greeting_start_time = now
                         greeting_started = False
                     else:
                         logger.warning("No user was detected.")
@@ -703,36 +1049,74 @@ def main() -> None:
                                 f"Hello {detected_user}, welcome to ADA, your personal digital assistant."
                             )
                         except Exception as e:
-                            logger.error(f"Error playing greeting: {e}")
+                            logger.error("Error playing greeting: %s", e)
 
-                    # Start the greeting thread
-                    greeting_thread = threading.Thread(target=play_greeting)
-                    greeting_thread.daemon = True
-                    greeting_thread.start()
+                    # Play the greeting on the shared worker pool
+                    _EXEC.submit(play_greeting)
                     greeting_started = True
 
                 # Keep displaying the visual greeting while the audio plays
                 greeting_completed = display_greeting(
-                    frame, detected_user, greeting_start_time
+                    frame, detected_user, greeting_start_time, now
                 )
 
             # STATE 4: After greeting, activate ADA core functionality
             else:
-                activate_ada(frame)
-
-            # Display the frame (common for all states)
-            cv2.imshow("ADA System", frame)
-
-            # Check for 'q' key press (common for all states)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
+                activate_ada(frame, now)
+
+            # Nobody sees frames while the window is minimized/hidden, so skip
+            # the display upload and drop to ~2Hz; the grabber keeps draining
+            # the camera and the state machine above still ran this iteration.
+            # A *destroyed* window (user clicked close) also reports not
+            # visible, but there pollKey has nothing to deliver 'q' through -
+            # probe for existence first and treat a gone window as quit.
+            try:
+                if cv2.getWindowProperty("ADA System", cv2.WND_PROP_AUTOSIZE) < 0:
+                    logger.info("Display window closed, exiting")
+                    running = False
+                    break
+                window_visible = (
+                    cv2.getWindowProperty("ADA System", cv2.WND_PROP_VISIBLE) >= 1
+                )
+            except cv2.error:
+                # Some backends throw instead of returning -1 once the window
+                # is gone; same meaning, same exit
+                logger.info("Display window closed, exiting")
                 running = False
                 break
+            if window_visible:
+                # Display the frame (common for all states)
+                _show_frame("ADA System", frame)
+
+            # Check for 'q' key press (common for all states), pollKey is non-blocking
+            # unlike waitKey(1) which sleeps at least a millisecond while pumping HighGUI
+            key = cv2.pollKey()
+            if key != -1 and (key & 0xFF) == ord("q"):
+                running = False
+                break
+
+            if not window_visible:
+                # Throttled cadence while hidden, enough to notice a re-show
+                time.sleep(0.5)
+                next_tick = time.monotonic() + DISPLAY_INTERVAL
+                continue
+
+            # Pace the loop at a fixed cadence, sleeping whatever remains of this tick
+            sleep_time = next_tick - time.monotonic()
+            if sleep_time > 0:
+                time.sleep(sleep_time)
+                next_tick += DISPLAY_INTERVAL
+            else:
+                # We fell behind (slow frame), restart the ticker from now
+                next_tick = time.monotonic() + DISPLAY_INTERVAL
 
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
 
     finally:
         # Release resources and close windows
+        _EXEC.shutdown(wait=False, cancel_futures=True)
+        grabber.stop()
         video_capture.release()
         cv2.destroyAllWindows()
         mixer.quit()  # Clean up the audio mixer
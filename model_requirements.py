@@ -1,11 +1,31 @@
 #!/usr/bin/env python3
 
+import hashlib
+import io
 import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
 import zipfile
 import tarfile
 
+# Optional accelerator: rapidgzip inflates gzip across all cores instead of
+# zlib's single thread. Purely opportunistic, everything works without it.
+try:
+    import rapidgzip
+
+    _HAVE_RAPIDGZIP = True
+except ImportError:
+    _HAVE_RAPIDGZIP = False
+
 # Fix the models directory path to point to the Models folder
 MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Models")
 
@@ -13,69 +33,555 @@ MODEL_URLS = {
     "vosk-model-small-en-us-0.15": "https://alphacephei.com/vosk/models/vosk-model-small-en-us-0.15.zip",
 }
 
+# Expected SHA-256 per downloaded filename. Files without an entry skip
+# verification; add the digest here when pinning a model version.
+MODEL_HASHES = {}
+
+# Copy granularity for streamed downloads
+_CHUNK_SIZE = 1024 * 1024
+
+# Retry attempts per download, backing off 1s/2s between tries
+_MAX_ATTEMPTS = 3
+
+# Files at least this large are fetched over several parallel connections
+_SEGMENT_THRESHOLD = 32 * 1024 * 1024
+_SEGMENTS = 4
+
+# Content-addressed download cache, hardlinked into place on reuse
+_BLOBS_DIR = os.path.join(MODELS_DIR, ".blobs")
+
+# One requests.Session per worker thread (sessions are not thread-safe), so each
+# model reuses its connection instead of paying a TCP+TLS handshake per request
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's pooled HTTP session, creating it on first use."""
+    if not hasattr(_thread_local, "session"):
+        session = requests.Session()
+        # Pool enough sockets for the segmented downloads sharing one host,
+        # and retry gateway hiccups at the transport layer so the resume
+        # logic in download_file only has to deal with mid-body failures
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504]
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return _thread_local.session
+
+
+def _progress_bar(**kwargs) -> tqdm:
+    """
+    Byte-unit tqdm bar, silenced when stderr is not a terminal (CI, Docker
+    logs) so large fast downloads don't burn cycles formatting ANSI output
+    nobody sees. mininterval rate-limits terminal redraws.
+    """
+    return tqdm(
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        mininterval=0.5,
+        disable=not sys.stderr.isatty(),
+        **kwargs,
+    )
+
+
+def _checksum_ok(path: str, filename: str = None) -> bool:
+    """
+    Verify a downloaded file against MODEL_HASHES (sha256, hardware-accelerated
+    through OpenSSL on modern CPUs). Files without a pinned digest pass. The
+    bytes are still in page cache right after the download, so this is a fast
+    single pass.
+
+    Args:
+        path: file to hash
+        filename: key into MODEL_HASHES, defaults to the basename of path
+    """
+    expected = MODEL_HASHES.get(filename or os.path.basename(path))
+    if not expected:
+        return True
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest() == expected
+
+
+def _etag_path(path: str) -> str:
+    """Sidecar file holding the ETag a model was downloaded with."""
+    return path + ".etag"
+
+
+def _save_etag(path: str, etag: str) -> None:
+    """Record the ETag for a downloaded model so later runs can validate it."""
+    if etag:
+        with open(_etag_path(path), "w") as f:
+            f.write(etag)
+
+
+def _is_current(url: str, path: str) -> bool:
+    """
+    Check whether an existing model still matches the server's copy.
+
+    Compares the stored ETag sidecar against a HEAD request. Without a sidecar
+    (downloads from before ETags were recorded) presence wins, matching the old
+    behaviour; a failed HEAD also keeps the local copy rather than re-fetching.
+    """
+    try:
+        with open(_etag_path(path)) as f:
+            stored = f.read().strip()
+    except OSError:
+        return True
+    try:
+        response = _get_session().head(url, allow_redirects=True, timeout=10)
+        remote = response.headers.get("ETag", "")
+    except requests.RequestException:
+        return True
+    return not remote or remote == stored
+
+
+def _blob_path(destination: str) -> str:
+    """
+    Content-addressed cache location for a download, keyed by its pinned
+    SHA-256 so the same bytes dedupe across mirrors and renamed model
+    directories. Downloads without a pinned digest return None and skip the
+    cache entirely: a blob keyed any other way (e.g. by URL) could never be
+    invalidated when the server's copy changes, which would defeat the ETag
+    revalidation that triggers re-downloads in the first place.
+    """
+    key = MODEL_HASHES.get(os.path.basename(destination))
+    return os.path.join(_BLOBS_DIR, key) if key else None
+
+
+def _store_blob(destination: str) -> None:
+    """Hardlink a finished download into the blob cache (free on same FS)."""
+    blob = _blob_path(destination)
+    if blob is None:
+        return
+    os.makedirs(_BLOBS_DIR, exist_ok=True)
+    try:
+        os.link(destination, blob)
+    except FileExistsError:
+        pass
+    except OSError:
+        # Cross-device or filesystem without hardlinks: cache is best-effort
+        pass
+
+
+def _restore_from_blobs(destination: str) -> bool:
+    """Materialise a destination from the blob cache if the bytes are there."""
+    blob = _blob_path(destination)
+    if blob is None or not os.path.exists(blob) or not _checksum_ok(
+        blob, os.path.basename(destination)
+    ):
+        return False
+    # Link beside the target and rename over it, so a stale destination is
+    # actually replaced rather than shadowing the cached copy
+    staging = destination + ".blobtmp"
+    try:
+        try:
+            os.link(blob, staging)
+        except FileExistsError:
+            os.remove(staging)
+            os.link(blob, staging)
+        os.replace(staging, destination)
+    except OSError:
+        shutil.copyfile(blob, destination)
+    return True
+
+
+def download_file(url: str, destination: str, position: int = 0) -> str:
+    """
+    Download a file with progress bar.
+
+    Downloads go to a .part file that is renamed into place only on success,
+    and interrupted transfers resume from where they stopped via an HTTP Range
+    request instead of restarting from byte zero. Transient failures are
+    retried with exponential backoff.
+    """
+    # Same bytes already in the blob cache (earlier run, different directory
+    # name, different mirror with a pinned hash): hardlink instead of fetching
+    if _restore_from_blobs(destination):
+        return destination
+
+    part_path = destination + ".part"
+
+    # Large files on range-capable servers go over parallel connections, which
+    # sidesteps the per-connection TCP window cap on fat pipes
+    try:
+        head = _get_session().head(url, allow_redirects=True, timeout=10)
+        size = int(head.headers.get("content-length", 0))
+        if (
+            head.headers.get("Accept-Ranges") == "bytes"
+            and size >= _SEGMENT_THRESHOLD
+        ):
+            _download_segmented(url, destination, size, position=position)
+            if not _checksum_ok(destination):
+                os.remove(destination)
+                raise OSError(f"Checksum mismatch for {destination}")
+            _save_etag(destination, head.headers.get("ETag", ""))
+            _store_blob(destination)
+            return destination
+    except (requests.RequestException, OSError):
+        # Fall through to the plain sequential path below
+        pass
+
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            # Resume from an earlier partial download if one is lying around
+            resume_pos = (
+                os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            )
+            headers = {"Range": f"bytes={resume_pos}-"} if resume_pos else {}
+
+            response = _get_session().get(url, stream=True, headers=headers)
+            response.raise_for_status()
+            response.raw.decode_content = True
+            if resume_pos and response.status_code != 206:
+                # Server ignored the range request, start over
+                resume_pos = 0
+            total_size = int(response.headers.get("content-length", 0)) + resume_pos
+
+            with (
+                open(part_path, "ab" if resume_pos else "wb") as f,
+                _progress_bar(
+                    desc=os.path.basename(destination),
+                    initial=resume_pos,
+                    total=total_size,
+                    position=position,
+                ) as bar,
+            ):
+                if not resume_pos and total_size and hasattr(os, "posix_fallocate"):
+                    # Reserve the blocks up front, same as the segmented path:
+                    # no allocation churn mid-stream and no fragmentation
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+
+                try:
+                    # 1 MiB copies via copyfileobj instead of 1 KiB iter_content
+                    # chunks: ~1000x fewer Python-level iterations and write
+                    # syscalls per MiB, with the progress bar ticked from the
+                    # wrapped raw stream
+                    shutil.copyfileobj(
+                        CallbackIOWrapper(bar.update, response.raw, "read"),
+                        f,
+                        length=_CHUNK_SIZE,
+                    )
+                except Exception:
+                    # posix_fallocate extended st_size to the full download, so
+                    # getsize() can no longer tell the retry where the transfer
+                    # stopped; cut the file back to the bytes actually written
+                    # before the next attempt computes its Range offset
+                    f.truncate(f.tell())
+                    raise
 
-def download_file(url: str, destination: str) -> str:
-    """Download a file with progress bar"""
-    response = requests.get(url, stream=True)
-    total_size = int(response.headers.get("content-length", 0))
+            if not _checksum_ok(part_path, os.path.basename(destination)):
+                # Corrupted transfer: throw the partial away and let the retry
+                # loop fetch it again from scratch
+                os.remove(part_path)
+                raise OSError(f"Checksum mismatch for {destination}")
 
-    with (
-        open(destination, "wb") as f,
-        tqdm(
+            os.replace(part_path, destination)
+            _save_etag(destination, response.headers.get("ETag", ""))
+            _store_blob(destination)
+            return destination
+        except (requests.RequestException, OSError):
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            backoff = 2**attempt
+            print(f"Download of {url} failed, retrying in {backoff}s...")
+            time.sleep(backoff)
+
+
+def _download_segmented(
+    url: str, destination: str, total_size: int, position: int = 0
+) -> None:
+    """
+    Fetch one file over several parallel Range requests into a preallocated
+    .part file, each worker writing its segment with os.pwrite (positioned
+    writes on a shared fd are thread-safe on POSIX). Renamed into place on
+    success like the sequential path.
+    """
+    part_path = destination + ".part"
+    bounds = []
+    segment_size = total_size // _SEGMENTS
+    for i in range(_SEGMENTS):
+        start = i * segment_size
+        end = total_size - 1 if i == _SEGMENTS - 1 else start + segment_size - 1
+        bounds.append((start, end))
+
+    fd = os.open(part_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            # Reserve the blocks up front so the parallel writers don't fight
+            # over allocation and the file lands unfragmented
+            os.posix_fallocate(fd, 0, total_size)
+
+        with _progress_bar(
             desc=os.path.basename(destination),
             total=total_size,
-            unit="B",
-            unit_scale=True,
-            unit_divisor=1024,
-        ) as bar,
-    ):
-        for data in response.iter_content(chunk_size=1024):
-            size = f.write(data)
-            bar.update(size)
+            position=position,
+        ) as bar:
+            bar_lock = threading.Lock()
+
+            def _fetch_segment(segment: tuple) -> None:
+                start, end = segment
+                response = _get_session().get(
+                    url, headers={"Range": f"bytes={start}-{end}"}, stream=True
+                )
+                response.raise_for_status()
+                offset = start
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    with bar_lock:
+                        bar.update(len(chunk))
+
+            with ThreadPoolExecutor(max_workers=_SEGMENTS) as executor:
+                list(executor.map(_fetch_segment, bounds))
+    except BaseException:
+        # The fallocated .part is full-size with holes where segments died,
+        # which the sequential fallback would misread as a resumable partial;
+        # throw it away so that path starts from byte zero
+        os.close(fd)
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+    else:
+        os.close(fd)
+
+    os.replace(part_path, destination)
+
+
+def download_and_extract(
+    url: str, extract_dir: str, position: int = 0, etag_target: str = None
+) -> None:
+    """
+    Download an archive and extract it without writing the archive to disk.
+    When etag_target is given, the response ETag is recorded in a sidecar next
+    to that path so later runs can cheaply validate the extracted model.
+
+    Tarballs stream straight from the HTTP response into tarfile, so download
+    and decompression overlap. Zip archives keep their central directory at the
+    end of the file, so the response is buffered in memory once and extracted
+    from there - still one full disk pass instead of write-archive, read-archive,
+    write-contents, delete-archive.
+    """
+    with _get_session().get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        total_size = int(response.headers.get("content-length", 0))
+
+        with _progress_bar(
+            desc=os.path.basename(url),
+            total=total_size,
+            position=position,
+        ) as bar:
+            # The wrapper ticks the progress bar on every read from the stream
+            stream = CallbackIOWrapper(bar.update, response.raw, "read")
+            _extractor_for(url)(stream, extract_dir, url)
+
+        if etag_target:
+            _save_etag(etag_target, response.headers.get("ETag", ""))
+
+
+def _wanted(name: str) -> bool:
+    """
+    Whether an archive member is needed at runtime. Documentation shipped
+    inside model archives (READMEs, licenses, markdown) is skipped - fewer
+    bytes inflated and written for members nothing ever reads.
+    """
+    base = os.path.basename(name)
+    return not (
+        base.startswith(("README", "LICENSE", "CHANGELOG")) or base.endswith(".md")
+    )
+
+
+def _extract_tar(tar_ref: tarfile.TarFile, extract_dir: str) -> None:
+    """Extract the runtime-relevant members of an open tar stream."""
+    members = (m for m in tar_ref if _wanted(m.name))
+    try:
+        # The "data" filter (3.12+, backported to recent 3.10/3.11) blocks
+        # path traversal and odd member types, and skips some stat work
+        tar_ref.extractall(extract_dir, members=members, filter="data")
+    except TypeError:
+        tar_ref.extractall(extract_dir, members=members)
+
 
-    return destination
+def _extract_tar_cli(stream, extract_dir: str) -> None:
+    """
+    Feed the HTTP stream straight into the system tar binary. The C copy loop
+    is measurably faster than tarfile's Python-level one, and when pigz is
+    installed (optional) the gunzip side runs across cores too.
+    """
+    cmd = ["tar", "-x", "-C", extract_dir]
+    cmd += ["--use-compress-program=pigz" if shutil.which("pigz") else "-z"]
+    # Mirror _wanted(): documentation members are not worth inflating
+    cmd += ["--exclude=README*", "--exclude=LICENSE*", "--exclude=CHANGELOG*",
+            "--exclude=*.md"]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        shutil.copyfileobj(stream, proc.stdin, length=_CHUNK_SIZE)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    if proc.wait() != 0:
+        raise OSError(f"tar exited with status {proc.returncode}")
 
 
-def extract_archive(archive_path: str, extract_dir: str) -> None:
-    """Extract ZIP or TAR archives"""
-    if archive_path.endswith(".zip"):
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
-    elif archive_path.endswith((".tar.gz", ".tgz")):
-        with tarfile.open(archive_path, "r:gz") as tar_ref:
-            tar_ref.extractall(extract_dir)
+def _extract_tar_stream(stream, extract_dir: str, url: str) -> None:
+    """Extract a gzipped tarball member-by-member as the bytes arrive."""
+    if shutil.which("tar"):
+        _extract_tar_cli(stream, extract_dir)
+    elif _HAVE_RAPIDGZIP:
+        # Multi-core inflate; tarfile then reads the already
+        # decompressed stream ("r|" = uncompressed, sequential)
+        with (
+            rapidgzip.open(stream, parallelization=os.cpu_count()) as gz,
+            tarfile.open(fileobj=gz, mode="r|") as tar_ref,
+        ):
+            _extract_tar(tar_ref, extract_dir)
+    else:
+        # Streaming mode ("r|gz") reads members sequentially as bytes
+        # arrive, no seeking and no buffering of the whole archive
+        with tarfile.open(fileobj=stream, mode="r|gz") as tar_ref:
+            _extract_tar(tar_ref, extract_dir)
 
-    # Remove the archive after extraction
-    os.remove(archive_path)
+
+def _extract_zip_stream(stream, extract_dir: str, url: str) -> None:
+    """Buffer a zip response (central directory sits at EOF) and extract it."""
+    data = stream.read()
+    expected = MODEL_HASHES.get(os.path.basename(url))
+    if expected and hashlib.sha256(data).hexdigest() != expected:
+        raise OSError(f"Checksum mismatch for {url}")
+    _extract_zip_parallel(data, extract_dir)
+
+
+# Suffix -> extractor dispatch, checked longest suffix first so ".tar.gz" wins
+# over a hypothetical ".gz" entry
+EXTRACTORS = {
+    ".tar.gz": _extract_tar_stream,
+    ".tgz": _extract_tar_stream,
+    ".zip": _extract_zip_stream,
+}
+
+
+def _extractor_for(url: str):
+    """Return the extractor handling this URL's archive suffix, or None."""
+    name = url.lower()
+    for suffix, extractor in EXTRACTORS.items():
+        if name.endswith(suffix):
+            return extractor
+    return None
+
+
+def _extract_zip_parallel(data: bytes, extract_dir: str) -> None:
+    """
+    Extract a zip held in memory using one worker per core. zlib releases the
+    GIL while inflating, so member decompression and the disk writes genuinely
+    overlap - the Vosk archive has hundreds of files. ZipFile instances are not
+    thread-safe over a shared handle, so each worker opens its own view of the
+    buffer (BytesIO shares the bytes copy-on-write) and extracts a slice of the
+    member list.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as zip_ref:
+        members = [m for m in zip_ref.infolist() if _wanted(m.filename)]
+
+    # Create the whole directory tree up front, single-threaded. ZipFile's
+    # _extract_member makedirs without exist_ok, so two workers writing the
+    # first files of the same fresh directory would race to FileExistsError.
+    for member in members:
+        if member.is_dir():
+            target = os.path.join(extract_dir, member.filename)
+        else:
+            target = os.path.dirname(os.path.join(extract_dir, member.filename))
+        if target:
+            os.makedirs(target, exist_ok=True)
+
+    files = [m for m in members if not m.is_dir()]
+    if not files:
+        return
+
+    workers = min(os.cpu_count() or 1, len(files)) or 1
+
+    def _extract_slice(worker_index: int) -> None:
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            for member in files[worker_index::workers]:
+                z.extract(member, extract_dir)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() materializes the map so worker exceptions propagate here
+        list(executor.map(_extract_slice, range(workers)))
+
+
+def _fetch_one(position: int, model_name: str, url: str, existing: set) -> None:
+    """
+    Download one model if it is not already present (worker body).
+
+    Args:
+        existing: snapshot of MODELS_DIR entry names taken once in
+            download_models, so presence checks are set lookups, not stat calls
+    """
+    # For direct files (like .gguf)
+    if url.endswith((".gguf", ".bin", ".pt")):
+        filename = os.path.basename(url)
+        target_path = os.path.join(MODELS_DIR, filename)
+        if filename not in existing or not _is_current(url, target_path):
+            print(f"Downloading {model_name}...")
+            download_file(url, target_path, position=position)
+            print(f"Downloaded {model_name} to {target_path}")
+        else:
+            print(f"{model_name} already exists at {target_path}")
+
+    # For archives (anything with a registered extractor)
+    elif _extractor_for(url) is not None:
+        model_dir = os.path.join(MODELS_DIR, model_name)
+        # Keyed on the sentinel, not the directory: extractall creates the
+        # directory first, so a crash mid-extraction must not look complete
+        sentinel = os.path.join(model_dir, ".download_complete")
+        if (
+            model_name in existing
+            and os.path.exists(sentinel)
+            and _is_current(url, model_dir)
+        ):
+            print(f"{model_name} already exists at {model_dir}")
+        else:
+            if model_name in existing and not os.path.exists(sentinel):
+                print(f"Removing incomplete extraction of {model_name}...")
+                shutil.rmtree(model_dir, ignore_errors=True)
+            print(f"Downloading and extracting {model_name}...")
+            download_and_extract(
+                url, MODELS_DIR, position=position, etag_target=model_dir
+            )
+            if os.path.isdir(model_dir):
+                with open(sentinel, "w"):
+                    pass
+            print(f"Extracted {model_name} to {model_dir}")
 
 
 def download_models() -> None:
-    """Download all models if they don't exist"""
+    """Download all models if they don't exist, fetching them in parallel"""
     # Ensure the Models directory exists
     os.makedirs(MODELS_DIR, exist_ok=True)
 
-    for model_name, url in MODEL_URLS.items():
-        # For direct files (like .gguf)
-        if url.endswith((".gguf", ".bin", ".pt")):
-            target_path = os.path.join(MODELS_DIR, os.path.basename(url))
-            if not os.path.exists(target_path):
-                print(f"Downloading {model_name}...")
-                download_file(url, target_path)
-                print(f"Downloaded {model_name} to {target_path}")
-            else:
-                print(f"{model_name} already exists at {target_path}")
-
-        # For archives (like .zip)
-        elif url.endswith((".zip", ".tar.gz", ".tgz")):
-            model_dir = os.path.join(MODELS_DIR, model_name)
-            if not os.path.exists(model_dir):
-                print(f"Downloading and extracting {model_name}...")
-                archive_path = os.path.join(MODELS_DIR, os.path.basename(url))
-                download_file(url, archive_path)
-                extract_archive(archive_path, MODELS_DIR)
-                print(f"Extracted {model_name} to {model_dir}")
-            else:
-                print(f"{model_name} already exists at {model_dir}")
+    # One directory scan up front instead of a stat call per model entry
+    existing = {entry.name for entry in os.scandir(MODELS_DIR)}
+
+    # Downloads are network-bound, so overlap them across a small thread pool.
+    # Each worker gets its own tqdm row (position=i) so the bars don't interleave.
+    with ThreadPoolExecutor(max_workers=min(8, len(MODEL_URLS))) as executor:
+        futures = [
+            executor.submit(_fetch_one, i, model_name, url, existing)
+            for i, (model_name, url) in enumerate(MODEL_URLS.items())
+        ]
+        for future in futures:
+            future.result()  # propagate any download error
 
 
 if __name__ == "__main__":